@@ -4,13 +4,63 @@ This module provides tools to read combined financial data, construct a quarterl
 dataset, perform panel regression analysis, and create visualisations of capex growth.
 """
 
+import json
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import statsmodels.formula.api as smf
+import statsmodels.api as sm
 from statsmodels.regression.linear_model import RegressionResultsWrapper
 import plotly.express as px
 
 
+def _pct(a: np.ndarray) -> np.ndarray:
+    """Percentage change along the first axis, with a leading row of NaN.
+
+    Equivalent to ``pct_change(fill_method=None)`` without the pandas wrapping.
+    """
+    out = np.empty_like(a)
+    out[0] = np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(a[1:], a[:-1], out=out[1:])
+    out[1:] -= 1
+    return out
+
+
+@lru_cache(maxsize=4)
+def _fit_cached(
+    y_bytes: bytes, X_bytes: bytes, groups_bytes: bytes, exog_names: tuple[str, ...]
+) -> RegressionResultsWrapper:
+    """Fit the cluster-robust panel OLS, memoised on the raw bytes of its inputs.
+
+    Repeated fits on unchanged data (e.g. several EventSimulator instances in a
+    notebook session) return the cached results instead of re-estimating.
+
+    Arguments
+    ---------
+        y_bytes (bytes): float64 response vector
+        X_bytes (bytes): C-ordered float64 design matrix
+        groups_bytes (bytes): int64 cluster codes, one per observation
+        exog_names (tuple[str, ...]): Column names of the design matrix
+
+    Returns
+    -------
+        RegressionResultsWrapper: Fitted model results
+    """
+    y = np.frombuffer(y_bytes, dtype=np.float64)
+    X = np.frombuffer(X_bytes, dtype=np.float64).reshape(len(y), len(exog_names))
+    groups = np.frombuffer(groups_bytes, dtype=np.int64)
+
+    return sm.OLS(
+        pd.Series(y, name="Capex_Growth"),
+        pd.DataFrame(X, columns=list(exog_names)),
+        hasconst=True,
+    ).fit(
+        cov_type="cluster",
+        cov_kwds={"groups": groups},
+    )
+
+
 class DataAnalysis:
     """Class for performing data analysis on Magnificent Seven corporate data.
 
@@ -23,19 +73,21 @@ class DataAnalysis:
 
         Arguments
         ---------
-            data_dir (Path): Directory containing the combined_data.csv file
+            data_dir (Path): Directory containing the combined_data.parquet file
         """
         self.data_dir = data_dir
-        self.data = pd.read_csv(
-            self.data_dir / "combined_data.csv", index_col=0, parse_dates=True
-        )
+        self.data = pd.read_parquet(self.data_dir / "combined_data.parquet")
 
-    def build_panel(self) -> pd.DataFrame:
+    def build_panel(self, save: bool = True) -> pd.DataFrame:
         """Construct a quarterly panel dataset for the Magnificent Seven companies.
 
         Resamples data to quarterly frequency, computes growth rates and differences,
-        builds a panel structure with ticker and date as multi-index, and saves
-        the result to CSV.
+        builds a panel structure with ticker and date as multi-index, and optionally
+        saves the result to Parquet.
+
+        Arguments
+        ---------
+            save (bool): Write mag7_panel_quarterly.parquet to data_dir
 
         Returns
         -------
@@ -58,78 +110,164 @@ class DataAnalysis:
             .dropna(how="all")
         )
 
+        # Single precision is ample for these series and halves the bytes touched
+        data = data.astype(
+            dict.fromkeys(data.select_dtypes("float64").columns, "float32")
+        )
+
         # Compute changes/growth
         data["Delta_FedFunds"] = data["FedFunds"].diff()
         data["GDP_Growth"] = data["GDP"].pct_change(fill_method=None)
 
         magnificent_seven = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA"]
-        panel_list = []
 
-        for stock in magnificent_seven:
-            df = pd.DataFrame(
-                {
-                    "Ticker": stock,
-                    "Date": data.index,
-                    "FedFunds": data["FedFunds"],
-                    "Delta_FedFunds": data["Delta_FedFunds"],
-                    "GDP_Growth": data["GDP_Growth"],
-                    "Close": data.get(f"{stock}_close"),
-                    "Capex": data.get(f"{stock}_capex"),
-                    "Assets": data.get(f"{stock}_assets", pd.Series()),
-                }
-            )
-            df["Return"] = df["Close"].pct_change(fill_method=None)
-            df["Capex_Growth"] = df["Capex"].pct_change(fill_method=None)
-            panel_list.append(df.set_index(["Ticker", "Date"]))
+        # Per-ticker series in wide form, one column per ticker
+        close = data.reindex(columns=[f"{s}_close" for s in magnificent_seven])
+        capex = data.reindex(columns=[f"{s}_capex" for s in magnificent_seven])
+        assets = data.reindex(columns=[f"{s}_assets" for s in magnificent_seven])
 
+        wide = pd.concat(
+            [
+                data[["FedFunds", "Delta_FedFunds", "GDP_Growth"]],
+                close.set_axis([f"Close_{s}" for s in magnificent_seven], axis=1),
+                capex.set_axis([f"Capex_{s}" for s in magnificent_seven], axis=1),
+                assets.set_axis([f"Assets_{s}" for s in magnificent_seven], axis=1),
+                pd.DataFrame(
+                    _pct(close.to_numpy()),
+                    index=data.index,
+                    columns=[f"Return_{s}" for s in magnificent_seven],
+                ),
+                pd.DataFrame(
+                    _pct(capex.to_numpy()),
+                    index=data.index,
+                    columns=[f"Capex_Growth_{s}" for s in magnificent_seven],
+                ),
+            ],
+            axis=1,
+        )
+
+        # Reshape wide -> long in one pass to get the (Ticker, Date) panel
+        panel = pd.wide_to_long(
+            wide.rename_axis("Date").reset_index(),
+            stubnames=["Close", "Capex", "Assets", "Return", "Capex_Growth"],
+            i="Date",
+            j="Ticker",
+            sep="_",
+            suffix=r"[A-Z]+",
+        )
+        panel = panel.reset_index()
+        panel["Ticker"] = pd.Categorical(panel["Ticker"], categories=magnificent_seven)
         panel = (
-            pd.concat(panel_list)
+            panel.set_index(["Ticker", "Date"])[
+                [
+                    "FedFunds",
+                    "Delta_FedFunds",
+                    "GDP_Growth",
+                    "Close",
+                    "Capex",
+                    "Assets",
+                    "Return",
+                    "Capex_Growth",
+                ]
+            ]
             .sort_index()
             .dropna(subset=["Capex_Growth", "Delta_FedFunds"])
         )
-        panel.to_csv(self.data_dir / "mag7_panel_quarterly.csv")
+        if save:
+            panel.to_parquet(self.data_dir / "mag7_panel_quarterly.parquet")
         return panel
 
-    def panel_regression(self, panel: pd.DataFrame) -> RegressionResultsWrapper:
+    def panel_regression(
+        self, panel: pd.DataFrame, verbose: bool = False
+    ) -> RegressionResultsWrapper:
         """Estimate panel regression of capex growth on macroeconomic and firm variables.
 
-        Fits an OLS model with ticker fixed effects using statsmodels formula API.
-        Standard errors are clustered by ticker.
+        Fits an OLS model with ticker fixed effects on a pre-built design matrix
+        (intercept, regressors and ticker dummies). Standard errors are clustered
+        by ticker.
 
         Arguments
         ---------
             panel (pd.DataFrame): Quarterly panel dataset with multi-index
+            verbose (bool): Print the full statsmodels summary table
 
         Returns
         -------
             RegressionResultsWrapper: Fitted model results
         """
-
-        panel = panel.reset_index()
-
         reg_vars = [
             "Capex_Growth",
             "Delta_FedFunds",
             "GDP_Growth",
             "Return",
-            "Ticker",
         ]
 
-        panel = panel.dropna(subset=reg_vars).copy()
-        panel["Date"] = pd.to_datetime(panel["Date"])
+        # Ticker is an index level and never missing; Date is already datetime
+        panel = panel.dropna(subset=reg_vars).reset_index()
+
+        # Design matrix equivalent to
+        # "Capex_Growth ~ Delta_FedFunds + GDP_Growth + Return + C(Ticker)"
+        regressors = ["Delta_FedFunds", "GDP_Growth", "Return"]
+        tickers = panel["Ticker"].astype("category").cat.remove_unused_categories()
+        dummies = pd.get_dummies(tickers, drop_first=True)
+        X = np.column_stack(
+            [
+                np.ones(len(panel)),
+                panel[regressors].to_numpy(dtype=np.float64),
+                dummies.to_numpy(dtype=np.float64),
+            ]
+        )
+        exog_names = (
+            "Intercept",
+            *regressors,
+            *(f"C(Ticker)[T.{ticker}]" for ticker in dummies.columns),
+        )
 
-        model = smf.ols(
-            "Capex_Growth ~ Delta_FedFunds + GDP_Growth + Return + C(Ticker)",
-            data=panel,
-        ).fit(
-            cov_type="cluster",
-            cov_kwds={"groups": panel["Ticker"]},
+        model = _fit_cached(
+            panel["Capex_Growth"].to_numpy(dtype=np.float64).tobytes(),
+            X.tobytes(),
+            tickers.cat.codes.to_numpy(dtype=np.int64).tobytes(),
+            exog_names,
         )
 
-        print(model.summary())
+        if verbose:
+            print(model.summary())
 
         return model
 
+    def save_coefficients(
+        self, model: RegressionResultsWrapper, path: Path | None = None
+    ) -> Path:
+        """Persist the coefficients used for scenario simulation to JSON.
+
+        Only the intercept and the macro/return slopes are stored; ticker fixed
+        effects are not used by the simulator.
+
+        Arguments
+        ---------
+            model (RegressionResultsWrapper): Fitted panel regression results
+            path (Path | None): Output file, defaults to coefficients.json in data_dir
+
+        Returns
+        -------
+            Path: Location of the written JSON file
+        """
+        path = path or self.data_dir / "coefficients.json"
+        names = {
+            "intercept": "Intercept",
+            "coef_delta_fedfunds": "Delta_FedFunds",
+            "coef_gdp_growth": "GDP_Growth",
+            "coef_return": "Return",
+        }
+        coefficients = {
+            key: float(model.params[name])
+            for key, name in names.items()
+            if name in model.params
+        }
+        with open(path, "w") as f:
+            json.dump(coefficients, f, indent=2)
+        return path
+
     def visualise_panel(self, panel: pd.DataFrame) -> None:
         """Create line plot visualisation of quarterly capex growth rates.
 
@@ -140,7 +278,7 @@ class DataAnalysis:
         ---------
             panel (pd.DataFrame): Quarterly panel dataset with multi-index
         """
-        panel = panel.loc["2022-01-01":]
+        panel = panel[panel.index.get_level_values("Date") >= "2022-01-01"]
         fig = px.line(
             panel.reset_index(),
             x="Date",
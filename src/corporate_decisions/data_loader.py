@@ -3,13 +3,14 @@
 This module fetches stock price data for the 'Magnificent Seven' companies,
 macroeconomic indicators from FRED (Federal Reserve Economic Data),
 and selected fundamental metrics, then combines them into a single
-time-series DataFrame saved as a CSV file.
+time-series DataFrame saved as a Parquet file.
 
 Data sources:
     - Yahoo Finance (via yfinance)
     - FRED (Federal Reserve Economic Data via fredapi)
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yfinance as yf
 import pandas as pd
@@ -25,7 +26,7 @@ class DataLoader:
     This class handles the creation of a data directory and the retrieval
     of stock prices, Federal Funds Rate, real GDP, and selected fundamental
     metrics for the Magnificent Seven companies. The resulting dataset is
-    saved as a CSV file in the project's data directory.
+    saved as a Parquet file in the project's data directory.
     """
     def __init__(self) -> None:
         """Initialise the DataLoader and create the data storage directory.
@@ -35,16 +36,16 @@ class DataLoader:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
     def load_data(self) -> None:
-        """Fetch financial and macroeconomic data and save to CSV.
+        """Fetch financial and macroeconomic data and save to Parquet.
 
         This method:
             - Downloads daily closing prices for the Magnificent Seven stocks
             - Retrieves Federal Funds Rate and real GDP from FRED
             - Collects total assets, liabilities and capital expenditure data
             - Calculates debt-to-assets ratio and GDP growth
-            - Resamples all series to business-day frequency with forward-fill
+            - Resamples all series to quarter-end frequency with forward-fill
             - Combines all data into a single DataFrame
-            - Saves the result as 'combined_data.csv'
+            - Saves the result as 'combined_data.parquet'
 
         Returns
         -------
@@ -65,8 +66,8 @@ class DataLoader:
             "GDPC1", observation_start=start_date, observation_end=end_date
         )
 
-        fed_funds_q = fed_funds.resample("B").last().ffill()
-        gdp_q = gdp.resample("B").last().ffill()
+        fed_funds_q = fed_funds.resample("QE").last().ffill()
+        gdp_q = gdp.resample("QE").last().ffill()
 
         fred_data = pd.DataFrame(
             {
@@ -86,18 +87,22 @@ class DataLoader:
             return
 
         if isinstance(yf_data.columns, pd.MultiIndex):
-            stock_prices_q = yf_data["Close"].resample("B").last()
+            stock_prices_q = yf_data["Close"].resample("QE").last()
         else:
-            stock_prices_q = yf_data[["Close"]].resample("B").last()
+            stock_prices_q = yf_data[["Close"]].resample("QE").last()
 
         fundamentals_list = []
 
-        for symbol in magnificent_seven:
-            ticker = yf.Ticker(symbol)
+        # Fundamentals are two HTTP round-trips per ticker; overlap them in threads
+        with ThreadPoolExecutor(max_workers=len(magnificent_seven)) as executor:
+            futures = {
+                symbol: executor.submit(self._fetch_fundamentals, symbol)
+                for symbol in magnificent_seven
+            }
 
+        for symbol, future in futures.items():
             try:
-                cashflow = ticker.cashflow
-                balance = ticker.balance_sheet
+                cashflow, balance = future.result()
             except Exception as e:
                 print("    Error fetching data for %s: %s" % (symbol, e))
                 continue
@@ -127,21 +132,39 @@ class DataLoader:
 
             fund_df.index = pd.to_datetime(fund_df.index)
             fund_df = fund_df.sort_index()
-            fund_df_q = fund_df.resample("B").last().ffill()
+            fund_df_q = fund_df.resample("QE").last().ffill()
             fundamentals_list.append(fund_df_q)
 
-        combined_data = fred_data.copy()
-
-        for symbol in magnificent_seven:
-            if symbol in stock_prices_q.columns:
-                combined_data[f"{symbol}_close"] = stock_prices_q[symbol]
-
-        for fund_df in fundamentals_list:
-            combined_data = combined_data.join(fund_df, how="outer")
+        # Close prices are aligned to the FRED calendar, fundamentals are outer-joined
+        close_symbols = [s for s in magnificent_seven if s in stock_prices_q.columns]
+        stock_close_df = (
+            stock_prices_q[close_symbols].reindex(fred_data.index).add_suffix("_close")
+        )
 
+        combined_data = pd.concat(
+            [fred_data, stock_close_df, *fundamentals_list], axis=1, join="outer"
+        )
         combined_data = combined_data.sort_index()
         combined_data = combined_data.loc[start_date:end_date]
-        combined_data.to_csv(self.data_dir / "combined_data.csv")
+        combined_data.to_parquet(
+            self.data_dir / "combined_data.parquet", compression="snappy"
+        )
+
+    def _fetch_fundamentals(self, symbol: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Download the annual cash-flow statement and balance sheet for a ticker.
+
+        Parameters
+        ----------
+        symbol : str
+            Yahoo Finance ticker symbol.
+
+        Returns
+        -------
+        tuple[pd.DataFrame, pd.DataFrame]
+            The cash-flow statement and the balance sheet.
+        """
+        ticker = yf.Ticker(symbol)
+        return ticker.cashflow, ticker.balance_sheet
 
 
 def main() -> None:
@@ -4,6 +4,7 @@ This module uses fitted panel regression coefficients to project forward-looking
 capital expenditure growth under hypothetical Fed policy paths.
 """
 
+import json
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -13,6 +14,37 @@ from plotly.subplots import make_subplots
 from src.corporate_decisions.data_analysis import DataAnalysis
 
 
+def _simulate_kernel(
+    intercept: float,
+    b_ff: float,
+    b_gdp: float,
+    b_ret: float,
+    returns: np.ndarray,
+    rate: float,
+    gdp: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute predicted and compounded capex growth for every quarter and ticker.
+
+    Arguments
+    ---------
+        intercept (float): Regression intercept
+        b_ff (float): Coefficient on the Fed Funds rate change
+        b_gdp (float): Coefficient on GDP growth
+        b_ret (float): Coefficient on the stock return
+        returns (np.ndarray): Simulated returns, shape (quarters, tickers)
+        rate (float): Fed Funds rate change per quarter
+        gdp (float): Quarterly GDP growth assumption
+
+    Returns
+    -------
+        tuple[np.ndarray, np.ndarray]: Predicted quarterly capex growth and the
+        cumulative capex change, both shaped like ``returns``
+    """
+    pcg = (intercept + b_ff * rate + b_gdp * gdp) + b_ret * returns
+    cum = np.cumprod(1 + pcg, axis=0) - 1.0
+    return pcg, cum
+
+
 class EventSimulator:
     """Class for simulating corporate capex responses to monetary policy scenarios.
 
@@ -20,29 +52,43 @@ class EventSimulator:
     different Fed rate change assumptions.
     """
 
-    def __init__(self, data_directory: Path) -> None:
+    def __init__(self, data_directory: Path, refit: bool = False) -> None:
         """Initialise the EventSimulator with historical panel data.
 
+        Regression coefficients are read from coefficients.json when it is newer
+        than the panel file; otherwise the panel regression is fitted and the
+        coefficients are saved for subsequent runs.
+
         Arguments
         ---------
             data_directory (Path): Path to the corporate_decisions data folder
+            refit (bool): Force the panel regression to be re-estimated
         """
         repo_root = Path(__file__).resolve().parents[2]
         self.data_directory = repo_root / data_directory
 
         # Load historical panel data
-        panel_path = self.data_directory / "mag7_panel_quarterly.csv"
-        self.data = pd.read_csv(panel_path, index_col=[0, 1], parse_dates=True)
-
-        # Fit the panel regression model
-        analysis = DataAnalysis(data_dir=self.data_directory)
-        self.model = analysis.panel_regression(panel=self.data)
+        panel_path = self.data_directory / "mag7_panel_quarterly.parquet"
+        self.data = pd.read_parquet(panel_path)
+
+        # Fit the panel regression model only if no up-to-date coefficients exist
+        coefficients_path = self.data_directory / "coefficients.json"
+        self.model = None
+        if (
+            refit
+            or not coefficients_path.exists()
+            or coefficients_path.stat().st_mtime < panel_path.stat().st_mtime
+        ):
+            analysis = DataAnalysis(data_dir=self.data_directory)
+            self.model = analysis.panel_regression(panel=self.data)
+            analysis.save_coefficients(self.model, coefficients_path)
 
         # Extract coefficients for simulation
-        self._extract_coefficients()
+        with open(coefficients_path) as f:
+            self._extract_coefficients(json.load(f))
 
         # Get most recent values for simulation baseline
-        self.last_date = self.data.reset_index()["Date"].max()
+        self.last_date = self.data.index.get_level_values("Date").max()
         self.magnificent_seven = [
             "AAPL",
             "MSFT",
@@ -53,15 +99,23 @@ class EventSimulator:
             "TSLA",
         ]
 
-    def _extract_coefficients(self) -> None:
-        """Extract regression coefficients from the fitted model."""
-        params = self.model.params
+        # Scenario-independent inputs, computed once for all simulate_event calls
+        available = set(self.data.index.get_level_values("Ticker").unique())
+        self._tickers = [t for t in self.magnificent_seven if t in available]
+        self._hist_return_vol = self.data["Return"].std()
+
+    def _extract_coefficients(self, coefficients: dict[str, float]) -> None:
+        """Store regression coefficients loaded from coefficients.json.
 
+        Arguments
+        ---------
+            coefficients (dict[str, float]): Coefficients keyed by attribute name
+        """
         # Store coefficients (with fallback defaults if not present)
-        self.coef_delta_fedfunds = params.get("Delta_FedFunds", -0.05)
-        self.coef_gdp_growth = params.get("GDP_Growth", 0.5)
-        self.coef_return = params.get("Return", 0.1)
-        self.intercept = params.get("Intercept", 0.02)
+        self.coef_delta_fedfunds = coefficients.get("coef_delta_fedfunds", -0.05)
+        self.coef_gdp_growth = coefficients.get("coef_gdp_growth", 0.5)
+        self.coef_return = coefficients.get("coef_return", 0.1)
+        self.intercept = coefficients.get("intercept", 0.02)
 
     def simulate_event(
         self,
@@ -69,6 +123,7 @@ class EventSimulator:
         quarters: int = 4,
         rate_change_per_quarter: float = 0.0,
         gdp_growth_assumption: float = 0.005,
+        seed: int = 42,
     ) -> pd.DataFrame:
         """Simulate forward-looking capex growth under a policy scenario.
 
@@ -78,73 +133,70 @@ class EventSimulator:
             quarters (int): Number of quarters to simulate forward
             rate_change_per_quarter (float): Fed Funds rate change per quarter (in pp, e.g., 0.25 for 25bp)
             gdp_growth_assumption (float): Assumed quarterly GDP growth rate (e.g., 0.005 for 0.5%)
+            seed (int): Seed for the simulated stock returns
 
         Returns
         -------
             pd.DataFrame: Simulated panel with predicted capex growth by ticker and quarter
         """
-        simulation_results = []
+        # Only simulate tickers present in the historical panel
+        tickers = self._tickers
+        n_tickers = len(tickers)
 
         # Historical average return volatility for forward simulation
-        hist_return_vol = self.data["Return"].std()
-
-        # Track cumulative changes per ticker
-        ticker_cumulative = {ticker: 1.0 for ticker in self.magnificent_seven}
-
-        for q in range(1, quarters + 1):
-            for ticker in self.magnificent_seven:
-                # Get most recent actual values for this ticker
-                ticker_data = self.data.reset_index()
-                ticker_data = ticker_data[ticker_data["Ticker"] == ticker].sort_values(
-                    "Date"
-                )
-
-                if ticker_data.empty:
-                    continue
-
-                # Project date forward
-                future_date = pd.Timestamp(self.last_date) + pd.DateOffset(months=3 * q)
-
-                # Simulate stock return (mean-reverting random walk with historical vol)
-                # Use a simple assumption: returns decay toward zero with some noise
-                np.random.seed(
-                    42 + q + hash(ticker) % 1000
-                )  # Reproducible but varied by ticker/quarter
-                simulated_return = np.random.normal(
-                    0.02, hist_return_vol
-                )  # Assume mild positive drift
-
-                # Policy shock in this quarter
-                delta_fedfunds = rate_change_per_quarter
-                gdp_growth = gdp_growth_assumption
-
-                # Predict capex growth using fitted model
-                predicted_capex_growth = (
-                    self.intercept
-                    + self.coef_delta_fedfunds * delta_fedfunds
-                    + self.coef_gdp_growth * gdp_growth
-                    + self.coef_return * simulated_return
-                )
-
-                # Update cumulative change (compound growth)
-                ticker_cumulative[ticker] *= 1 + predicted_capex_growth
-                cumulative_change = ticker_cumulative[ticker] - 1.0
-
-                simulation_results.append(
-                    {
-                        "Ticker": ticker,
-                        "Quarter": q,
-                        "Date": future_date,
-                        "Event_Type": event_type,
-                        "Delta_FedFunds": delta_fedfunds,
-                        "GDP_Growth": gdp_growth,
-                        "Simulated_Return": simulated_return,
-                        "Predicted_Capex_Growth": predicted_capex_growth,
-                        "Cumulative_Capex_Change": cumulative_change,
-                    }
-                )
-
-        return pd.DataFrame(simulation_results)
+        hist_return_vol = self._hist_return_vol
+
+        # One independent stream per ticker, so a ticker's path does not depend
+        # on which other tickers are present
+        streams = dict(
+            zip(
+                self.magnificent_seven,
+                np.random.default_rng(seed).spawn(len(self.magnificent_seven)),
+            )
+        )
+
+        # Simulate stock returns (mild positive drift with historical volatility)
+        simulated_returns = np.empty((quarters, n_tickers))
+        for j, ticker in enumerate(tickers):
+            simulated_returns[:, j] = streams[ticker].normal(
+                0.02, hist_return_vol, size=quarters
+            )
+
+        # Predict capex growth using fitted model and compound it per ticker
+        predicted_capex_growth, cumulative_change = _simulate_kernel(
+            self.intercept,
+            self.coef_delta_fedfunds,
+            self.coef_gdp_growth,
+            self.coef_return,
+            simulated_returns,
+            rate_change_per_quarter,
+            gdp_growth_assumption,
+        )
+
+        # Project quarter-end dates forward from the last observation
+        future_dates = pd.date_range(
+            start=pd.Timestamp(self.last_date) + pd.DateOffset(months=3),
+            periods=quarters,
+            freq="QE",
+        )
+
+        return pd.DataFrame(
+            {
+                "Ticker": pd.Categorical(
+                    np.tile(tickers, quarters), categories=self.magnificent_seven
+                ),
+                "Quarter": np.repeat(
+                    np.arange(1, quarters + 1, dtype=np.int16), n_tickers
+                ),
+                "Date": np.repeat(future_dates, n_tickers),
+                "Event_Type": event_type,
+                "Delta_FedFunds": rate_change_per_quarter,
+                "GDP_Growth": gdp_growth_assumption,
+                "Simulated_Return": simulated_returns.ravel(),
+                "Predicted_Capex_Growth": predicted_capex_growth.ravel(),
+                "Cumulative_Capex_Change": cumulative_change.ravel(),
+            }
+        )
 
     def plot_simulation(
         self, simulation_df: pd.DataFrame, title: str = "Policy Scenario Simulation"
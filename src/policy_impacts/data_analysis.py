@@ -6,13 +6,81 @@ This module provides functionality to:
 - Compare cumulative total returns of US Aggregate and UK Gilts ETFs
 """
 
+from functools import cached_property
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
+from scipy.linalg import solve_triangular
 import statsmodels.api as sm
 
 
+class OLSResult:
+    """Minimal OLS fit exposing the statsmodels attributes used in this project.
+
+    Attributes
+    ----------
+        params (pd.Series): Estimated coefficients indexed by regressor name
+        bse (pd.Series): Standard errors of the coefficients
+        rsquared (float): Coefficient of determination
+        resid (pd.Series): Regression residuals
+    """
+
+    def __init__(
+        self, params: pd.Series, bse: pd.Series, rsquared: float, resid: pd.Series
+    ) -> None:
+        self.params = params
+        self.bse = bse
+        self.rsquared = rsquared
+        self.resid = resid
+
+    def predict(self, exog: np.ndarray) -> np.ndarray:
+        """Return fitted values for a design matrix with the training column order."""
+        return np.asarray(exog, dtype=np.float64) @ self.params.to_numpy()
+
+
+def fit_ols_shared_design(X: pd.DataFrame, y: pd.DataFrame) -> list[OLSResult]:
+    """Fit one OLS regression per column of ``y`` on a common design matrix.
+
+    ``X`` is QR-factorised once and every response is solved against the cached
+    ``Q`` and ``R``, instead of decomposing the same design for each regression.
+
+    Arguments
+    ---------
+        X: Design matrix (including constant) with regressor names as columns
+        y: Response variables, one regression per column
+
+    Returns
+    -------
+        List of OLSResult, in the column order of ``y``
+    """
+    X_values = X.to_numpy(dtype=np.float64)
+    Y = y.to_numpy(dtype=np.float64)
+    n, k = X_values.shape
+
+    Q, R = np.linalg.qr(X_values)
+    beta = solve_triangular(R, Q.T @ Y)
+    resid = Y - X_values @ beta
+
+    # diag((X'X)^-1) from R alone: row norms of R^-1
+    R_inv = solve_triangular(R, np.eye(k))
+    xtx_inv_diag = (R_inv**2).sum(axis=1)
+    ssr = (resid**2).sum(axis=0)
+    bse = np.sqrt(np.outer(xtx_inv_diag, ssr / (n - k)))
+    rsquared = 1 - ssr / ((Y - Y.mean(axis=0)) ** 2).sum(axis=0)
+
+    return [
+        OLSResult(
+            params=pd.Series(beta[:, j], index=X.columns, name=name),
+            bse=pd.Series(bse[:, j], index=X.columns, name=name),
+            rsquared=float(rsquared[j]),
+            resid=pd.Series(resid[:, j], index=y.index, name=name),
+        )
+        for j, name in enumerate(y.columns)
+    ]
+
+
 class DataAnalysis:
     """Class for analysing bond market data with focus on yield curve spreads
     and monetary policy rate changes.
@@ -22,16 +90,33 @@ class DataAnalysis:
         data (pd.DataFrame): Time series data with Date index and financial metrics
     """
 
-    def __init__(self, data: Path) -> None:
-        """Initialise DataAnalysis with data from CSV file.
+    def __init__(self, data: Path | pd.DataFrame) -> None:
+        """Initialise DataAnalysis with data from Parquet file.
 
         Arguments
         ---------
-            data_path: Path to the CSV file containing the combined dataset
-            with Date index.
+            data_path: Path to the Parquet file containing the combined dataset
+            with Date index, or the already loaded DataFrame.
+
+        """
+        self.data = data if isinstance(data, pd.DataFrame) else pd.read_parquet(data)
+
+    @cached_property
+    def _returns(self) -> tuple[np.ndarray, np.ndarray]:
+        """Daily and cumulative returns of the AGG and IGLT.L ETFs, computed once.
+
+        Returns
+        -------
+            daily (np.ndarray): Daily returns, shape (n_rows, 2), first row NaN
+            cumulative (np.ndarray): Cumulative total returns, shape (n_rows, 2)
 
+            Column 0 is the US AGG ETF and column 1 the UK IGLT.L ETF.
         """
-        self.data = pd.read_csv(data, parse_dates=["Date"], index_col="Date")
+        close = self.data[["Close_AGG", "Close_IGLT_L"]].to_numpy(dtype=np.float64)
+        daily = np.full_like(close, np.nan)
+        daily[1:] = close[1:] / close[:-1] - 1
+        cumulative = np.cumprod(1 + np.nan_to_num(daily), axis=0) - 1
+        return daily, cumulative
 
     def visualise_yield_curves(self) -> None:
         """Create a two-panel Plotly figure showing US and UK yield curve spreads.
@@ -39,7 +124,7 @@ class DataAnalysis:
         Left panel:  US 10Y-2Y Treasury yield spread
         Right panel: UK 10Y Gilt minus 3M interbank rate spread
         """
-        data = self.data.copy()
+        data = self.data
         fig = make_subplots(
             rows=1,
             cols=2,
@@ -85,14 +170,10 @@ class DataAnalysis:
 
     def market_analysis(
         self,
-    ) -> tuple[
-        pd.DataFrame,
-        sm.regression.linear_model.RegressionResultsWrapper,
-        sm.regression.linear_model.RegressionResultsWrapper,
-    ]:
+    ) -> tuple[pd.DataFrame, OLSResult, OLSResult]:
         """Perform OLS regression of bond ETF returns on changes in spreads and policy rates.
 
-        Runs two separate regressions:
+        Runs two separate regressions sharing one QR factorisation of the design:
           - US AGG ETF daily returns
           - UK IGLT.L ETF daily returns
 
@@ -105,13 +186,14 @@ class DataAnalysis:
         Returns
         -------
             data (pd.DataFrame): DataFrame with computed returns and changes
-            model_us (RegressionResultsWrapper): Fitted OLS model for US bond returns
-            model_uk (RegressionResultsWrapper): Fitted OLS model for UK bond returns
+            model_us (OLSResult): Fitted OLS model for US bond returns
+            model_uk (OLSResult): Fitted OLS model for UK bond returns
         """
         data = self.data.copy()
-        # Compute bond returns
-        data["US_Bond_Returns"] = data["Close_AGG"].pct_change()
-        data["UK_Bond_Returns"] = data["Close_IGLT_L"].pct_change()
+        # Bond returns (shared with compare_bond_reactions)
+        daily_returns, _ = self._returns
+        data["US_Bond_Returns"] = daily_returns[:, 0]
+        data["UK_Bond_Returns"] = daily_returns[:, 1]
 
         data["US_Spread_Change"] = data["10Y-2Y Treasury Yield Spread"].diff()
         data["UK_Spread_Change"] = data["UK Bond Yield Spread"].diff()
@@ -134,12 +216,9 @@ class DataAnalysis:
             ]
         )
 
-        y_us = data["US_Bond_Returns"]
-        y_uk = data["UK_Bond_Returns"]
-
-        model_us = sm.OLS(y_us, X).fit()
-
-        model_uk = sm.OLS(y_uk, X).fit()
+        model_us, model_uk = fit_ols_shared_design(
+            X, data[["US_Bond_Returns", "UK_Bond_Returns"]]
+        )
 
         return data, model_us, model_uk
 
@@ -149,23 +228,22 @@ class DataAnalysis:
         Displays an interactive Plotly figure comparing the performance
         of AGG (US) and IGLT.L (UK) over time.
         """
-        data = self.data.copy()
-        # Compute bond returns
-        data["US_Bond_Returns"] = data["Close_AGG"].pct_change()
-        data["UK_Bond_Returns"] = data["Close_IGLT_L"].pct_change()
-
-        data["US_Cum_Return"] = (1 + data["US_Bond_Returns"].fillna(0)).cumprod() - 1
-        data["UK_Cum_Return"] = (1 + data["UK_Bond_Returns"].fillna(0)).cumprod() - 1
+        # Cumulative bond returns (shared with market_analysis)
+        _, cumulative_returns = self._returns
 
         fig = go.Figure()
         fig.add_trace(
             go.Scatter(
-                x=data.index, y=data["US_Cum_Return"], name="US AGG (cum return)"
+                x=self.data.index,
+                y=cumulative_returns[:, 0],
+                name="US AGG (cum return)",
             )
         )
         fig.add_trace(
             go.Scatter(
-                x=data.index, y=data["UK_Cum_Return"], name="UK IGLT.L (cum return)"
+                x=self.data.index,
+                y=cumulative_returns[:, 1],
+                name="UK IGLT.L (cum return)",
             )
         )
         fig.update_layout(
@@ -185,7 +263,7 @@ def main() -> None:
     and runs all available analyses.
     """
     repo_root = Path(__file__).parents[2].resolve()
-    data_path = repo_root / "data/policy_impacts/combined_data.csv"
+    data_path = repo_root / "data/policy_impacts/combined_data.parquet"
     analysis = DataAnalysis(data_path)
     analysis.visualise_yield_curves()
     _, _, _ = analysis.market_analysis()
@@ -2,10 +2,14 @@
 
 This module provides a ``DataLoader`` class that fetches historical data from the Federal Reserve Economic Data
 (FRED) service and Yahoo Finance, aligns the datasets on trading days, computes derived variables such as the UK
-Bond Yield Spread, and saves the cleaned combined dataset to a CSV file in the project's data directory.
+Bond Yield Spread, and saves the cleaned combined dataset to a Parquet file in the project's data directory.
 
 """
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 import pandas as pd
 from pathlib import Path
 from dotenv import load_dotenv
@@ -17,39 +21,57 @@ load_dotenv()
 
 pd.set_option('future.no_silent_downcasting', True)
 
+# Translation table mapping ticker punctuation to underscores for column suffixes
+_TICKER_TRANS = str.maketrans({".": "_", "-": "_"})
+
 
 class DataLoader:
     """A class responsible for loading, combining, and processing economic and market data.
 
     It fetches data from FRED (Federal Reserve Economic Data) and Yahoo Finance,
     aligns the datasets on trading days, computes returns and changes, and saves
-    the combined dataset to a CSV file.
+    the combined dataset to a Parquet file.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_ttl: float = 24 * 60 * 60) -> None:
         """Initialise the DataLoader instance.
 
         Determines the repository root directory and sets up the data directory
-        for saving the combined dataset.
+        for saving the combined dataset, plus a cache directory for downloads.
+
+        Parameters
+        ----------
+        cache_ttl : float, optional
+            Maximum age in seconds of a cached download before it is fetched
+            again, by default one day.
         """
         repo_root = Path(__file__).resolve().parents[2]
         self.data_dir = repo_root / "data" / "policy_impacts"
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = repo_root / "data" / ".cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
 
     def load_data(self) -> None:
         """Load, process, and save the combined economic and market dataset.
 
         Fetches data from FRED and Yahoo Finance, aligns them, computes S&P 500
         returns and federal funds rate changes, drops missing values, and saves
-        the result to CSV.
+        the result to Parquet.
         """
-        fred_data = self._load_fred_data()
-        yf_data = self._load_yf_data()
+        # FRED and Yahoo Finance downloads are network-bound; run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fred_future = executor.submit(self._load_fred_data)
+            yf_future = executor.submit(self._load_yf_data)
+            fred_data = fred_future.result()
+            yf_data = yf_future.result()
 
-        trading_days = yf_data.index
-        fred_data = fred_data.reindex(trading_days)
+        # Align FRED onto the trading calendar, carrying the latest observation
+        # forward, instead of outer-joining, re-sorting and forward-filling both
+        fred_data = fred_data.reindex(yf_data.index, method="ffill")
 
-        combined_data = self._combine_data(fred_data, yf_data)
+        combined_data = pd.concat([fred_data, yf_data], axis=1)
+        combined_data.index.name = "Date"
 
         #combined_data.dropna(inplace=True)
 
@@ -70,39 +92,40 @@ class DataLoader:
         fred_api_key = os.getenv("FRED_API_KEY")
         fred = Fred(api_key=fred_api_key)
 
-        ten_year_minus_two_year = fred.get_series(
-            series_id="T10Y2Y",
-            observation_start="2020-01-01",
-            observation_end="2025-12-31",
-        )
-        interbank_rates = fred.get_series(
-            series_id="IR3TIB01GBM156N",
-            observation_start="2020-01-01",
-            observation_end="2025-12-31",
-        )
-        
-        uk_10_year_rates = fred.get_series(
-            series_id="IRLTLT01GBM156N",
-            observation_start="2020-01-01",
-            observation_end="2025-12-31",
-        )
-        
-        fed_funds = fred.get_series(
-            series_id="FEDFUNDS",
-            observation_start="2020-01-01",
-            observation_end="2025-12-31",
-        )
-        
+        series_ids = ["T10Y2Y", "IR3TIB01GBM156N", "IRLTLT01GBM156N", "FEDFUNDS"]
+
+        def _get_series(series_id: str) -> pd.Series:
+            return self._cached_fetch(
+                f"fred:{series_id}:2020-01-01:2025-12-31",
+                lambda: fred.get_series(
+                    series_id=series_id,
+                    observation_start="2020-01-01",
+                    observation_end="2025-12-31",
+                ).to_frame(name=series_id),
+            )[series_id]
+
+        # Issue all FRED requests concurrently instead of back to back
+        with ThreadPoolExecutor(max_workers=len(series_ids)) as executor:
+            (
+                ten_year_minus_two_year,
+                interbank_rates,
+                uk_10_year_rates,
+                fed_funds,
+            ) = executor.map(_get_series, series_ids)
 
         ten_year_minus_two_year = ten_year_minus_two_year.to_frame(name="10Y-2Y Treasury Yield Spread")
         interbank_rates = interbank_rates.to_frame(name="IR3TIB01GBM156N")
         uk_10_year_rates = uk_10_year_rates.to_frame(name="UK 10-Year Government Bond Yield")
         fed_funds = fed_funds.to_frame(name="Federal Funds Rate")
-        uk_spread = self._combine_data(interbank_rates, uk_10_year_rates)
-        uk_spread['UK Bond Yield Spread'] = uk_spread['UK 10-Year Government Bond Yield'] - uk_spread['IR3TIB01GBM156N']
-
-        fred_data = self._combine_data(ten_year_minus_two_year, uk_spread)
-        fred_data = self._combine_data(fred_data, fed_funds)
+        # One multi-way combine instead of three chained pairwise ones
+        fred_data = self._combine_data(
+            ten_year_minus_two_year, interbank_rates, uk_10_year_rates, fed_funds
+        )
+        fred_data.insert(
+            fred_data.columns.get_loc("UK 10-Year Government Bond Yield") + 1,
+            "UK Bond Yield Spread",
+            fred_data["UK 10-Year Government Bond Yield"] - fred_data["IR3TIB01GBM156N"],
+        )
 
         return fred_data
 
@@ -124,54 +147,84 @@ class DataLoader:
         ticker_agg = "AGG"
         ticker_iglt = "IGLT.L"
 
-        yf_data_agg = yf.download(
-            tickers=ticker_agg,
-            start="2020-01-01",
-            end="2025-12-31",
-            progress=False,
-            multi_level_index=False,
+        # Download both tickers in one batched request
+        yf_data = self._cached_fetch(
+            f"yf:{ticker_agg},{ticker_iglt}:2020-01-01:2025-12-31",
+            lambda: yf.download(
+                tickers=[ticker_agg, ticker_iglt],
+                start="2020-01-01",
+                end="2025-12-31",
+                progress=False,
+                group_by="ticker",
+            ),
         )
 
-        if yf_data_agg is None or yf_data_agg.empty:
+        if yf_data is None or yf_data.empty:
+            raise ValueError(
+                f"No data fetched from Yahoo Finance for tickers {ticker_agg}, {ticker_iglt}"
+            )
+
+        yf_data_agg = yf_data[ticker_agg].dropna(how="all")
+        if yf_data_agg.empty:
             raise ValueError(f"No data fetched from Yahoo Finance for ticker {ticker_agg}")
-        
-        yf_data_iglt = yf.download(
-            tickers=ticker_iglt,
-            start="2020-01-01",
-            end="2025-12-31",
-            progress=False,
-            multi_level_index=False,
-        )
 
-        if yf_data_iglt is None or yf_data_iglt.empty:
+        yf_data_iglt = yf_data[ticker_iglt].dropna(how="all")
+        if yf_data_iglt.empty:
             raise ValueError(f"No data fetched from Yahoo Finance for ticker {ticker_iglt}")
 
         # Clean ticker strings for safe column suffixes
         def _clean_ticker(s):
-            return s.replace('.', '_').replace('-', '_')
+            return s.translate(_TICKER_TRANS)
 
         # Append ticker-specific suffix to each column to avoid overlapping names
-        yf_data_agg.columns = [f"{col}_{_clean_ticker(ticker_agg)}" for col in yf_data_agg.columns]
-        yf_data_iglt.columns = [f"{col}_{_clean_ticker(ticker_iglt)}" for col in yf_data_iglt.columns]
+        yf_data_agg = yf_data_agg.add_suffix(f"_{_clean_ticker(ticker_agg)}")
+        yf_data_iglt = yf_data_iglt.add_suffix(f"_{_clean_ticker(ticker_iglt)}")
 
         yf_data = self._combine_data(yf_data_agg, yf_data_iglt)
 
         return yf_data
 
-    def _combine_data(
-        self, dataset_1: pd.DataFrame, dataset_2: pd.DataFrame
+    def _cached_fetch(
+        self, key: str, fetch: Callable[[], pd.DataFrame]
     ) -> pd.DataFrame:
-        """Combine two DataFrames by joining on their indices.
+        """Return the result of ``fetch``, reusing an on-disk copy while it is fresh.
+
+        Downloads are stored as Parquet files in ``cache_dir``, named by a hash
+        of ``key``. A cached file younger than ``cache_ttl`` seconds is read back
+        instead of calling ``fetch``; empty results are never cached.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the request, e.g. source, series id and date range.
+        fetch : Callable[[], pd.DataFrame]
+            Function performing the download on a cache miss.
+
+        Returns
+        -------
+        pd.DataFrame
+            The cached or freshly downloaded data.
+        """
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        path = self.cache_dir / f"{digest}.parquet"
+        if path.exists() and time.time() - path.stat().st_mtime < self.cache_ttl:
+            return pd.read_parquet(path)
+
+        data = fetch()
+        if data is not None and not data.empty:
+            data.to_parquet(path)
+        return data
+
+    def _combine_data(self, *datasets: pd.DataFrame) -> pd.DataFrame:
+        """Combine DataFrames by joining on their indices.
 
-        Performs an outer join, sorts by date, forward-fills missing values,
-        and drops any remaining rows with NaN.
+        Performs a single outer concat of all inputs, sorts by date,
+        forward-fills missing values, and drops any remaining rows with NaN.
 
         Parameters
         ----------
-        dataset_1 : pd.DataFrame
-            The first dataset to combine.
-        dataset_2 : pd.DataFrame
-            The second dataset to combine.
+        *datasets : pd.DataFrame
+            The datasets to combine, in output column order.
 
         Returns
         -------
@@ -179,8 +232,11 @@ class DataLoader:
             The combined, cleaned DataFrame with 'Date' as the index name.
         """
 
-        data = dataset_1.join(dataset_2, how="outer")
-        data.sort_index(inplace=True)
+        # An outer concat on DatetimeIndexes already returns the sorted union,
+        # so only sort when an input arrived out of order
+        data = pd.concat(datasets, axis=1, join="outer")
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
 
         data = data.ffill().infer_objects(copy=False)
 
@@ -189,14 +245,18 @@ class DataLoader:
         return data
 
     def _save_data(self, combined_data: pd.DataFrame) -> None:
-        """Save the combined DataFrame to a CSV file.
+        """Save the combined DataFrame to a Parquet file.
 
         Parameters
         ----------
         combined_data : pd.DataFrame
             The processed DataFrame to save.
         """
-        combined_data.to_csv(self.data_dir / "combined_data.csv")
+        combined_data.to_parquet(
+            self.data_dir / "combined_data.parquet",
+            engine="pyarrow",
+            compression="zstd",
+        )
         
 def main():
     """Entry point for running the data loading process."""
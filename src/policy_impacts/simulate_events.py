@@ -6,6 +6,7 @@ This module provides functionality to:
 - Simulate future bond return paths under hypothetical rate change scenarios
 - Visualise cumulative return paths and spread evolution
 """
+import os
 from pathlib import Path
 import sys
 import pandas as pd
@@ -24,37 +25,45 @@ class EventSimulator:
 
     Attributes
     -----------
-        data_path (Path): Path to the input CSV data file
+        data_path (Path): Path to the input Parquet data file
         data (pd.DataFrame): Historical market data (loaded on demand)
         us_model: Fitted model for US bond returns
         uk_model: Fitted model for UK bond returns
-        last_date (pd.Timestamp): Most recent date in the training data
     """
     def __init__(self, data: Path) -> None:
         """Initialize the event simulator with data location.
 
         Arguments
         ----------
-            data: Path to the CSV file containing market data
+            data: Path to the Parquet file containing market data
         """
         self.data_path = data
         self.data = pd.DataFrame()
         self.us_model = None
         self.uk_model = None
-        self.last_date = pd.to_datetime("2020-01-01")
 
-    def fit_model(self) -> None:
+    def fit_model(self, data: pd.DataFrame | None = None) -> None:
         """Load data and train predictive models for US and UK bond returns.
 
         Calls the market_analysis() method from DataAnalysis to obtain
-        preprocessed data and fitted models.
+        preprocessed data and fitted models. Without ``data`` the models are
+        only fitted once, from ``data_path``; later calls reuse them, so
+        several scenarios can share one load and fit.
+
+        Arguments
+        ----------
+            data: Already loaded combined dataset to fit on instead of reading
+                  data_path; always triggers a refit
 
         Raises
         ------
             Whatever exceptions DataAnalysis.market_analysis() may raise
         """
+        if data is None and self.us_model is not None and self.uk_model is not None:
+            return
+
         self.data, self.us_model, self.uk_model = DataAnalysis(
-            self.data_path
+            self.data_path if data is None else data
         ).market_analysis()
 
     def simulate_event(
@@ -102,78 +111,71 @@ class EventSimulator:
                 "Models must be fitted before simulating events. Call fit_model() first."
             )
 
-        sim_index = pd.date_range(
-            start=self.last_date + pd.Timedelta(days=1), periods=months, freq="ME"
-        )
-        sim_data = pd.DataFrame(index=sim_index)
-
-        sim_data["Month"] = range(1, months + 1)
-
         monthly_us = total_us_rate_change / months
         monthly_uk = total_uk_rate_change / months
 
         current_us_spread = self.data["10Y-2Y Treasury Yield Spread"].iloc[-1]
         current_uk_spread = self.data["UK Bond Yield Spread"].iloc[-1]
-        cum_us_ret = 0.0
-        cum_uk_ret = 0.0
-
-        results = []
-
-        for i, _ in enumerate(sim_data.index):
-            us_spread_chg = spread_impact_factor * monthly_us
-            uk_spread_chg = spread_impact_factor * monthly_uk
 
-            X_new = np.array(
-                [[1, us_spread_chg, uk_spread_chg, monthly_us, monthly_uk]]
-            )
-
-            prediction_us_ret = self.us_model.predict(X_new)[0]
-            prediction_uk_ret = self.uk_model.predict(X_new)[0]
-
-            cum_us_ret += prediction_us_ret
-            cum_uk_ret += prediction_uk_ret
-            current_us_spread += us_spread_chg
-            current_uk_spread += uk_spread_chg
-
-            results.append(
-                {
-                    "Month": sim_data["Month"].iloc[i],
-                    "US_Rate_Change_Monthly": monthly_us,
-                    "UK_Rate_Change_Monthly": monthly_uk,
-                    "US_Spread_Change": us_spread_chg,
-                    "UK_Spread_Change": uk_spread_chg,
-                    "Predicted_US_Return": prediction_us_ret,
-                    "Predicted_UK_Return": prediction_uk_ret,
-                    "Cum_US_Return": cum_us_ret,
-                    "Cum_UK_Return": cum_uk_ret,
-                    "US_Spread_Level": current_us_spread,
-                    "UK_Spread_Level": current_uk_spread,
-                }
-            )
-
-        sim_results = pd.DataFrame(results).set_index("Month")
+        # Rate and spread increments are the same every month, so one predict
+        # call per model covers the whole horizon
+        us_spread_chg = spread_impact_factor * monthly_us
+        uk_spread_chg = spread_impact_factor * monthly_uk
+
+        X_new = np.array([[1, us_spread_chg, uk_spread_chg, monthly_us, monthly_uk]])
+
+        prediction_us_ret = self.us_model.predict(X_new)[0]
+        prediction_uk_ret = self.uk_model.predict(X_new)[0]
+
+        months_idx = np.arange(1, months + 1)
+        cum_us_ret = prediction_us_ret * months_idx
+        cum_uk_ret = prediction_uk_ret * months_idx
+
+        sim_results = pd.DataFrame(
+            {
+                "US_Rate_Change_Monthly": np.full(months, monthly_us),
+                "UK_Rate_Change_Monthly": np.full(months, monthly_uk),
+                "US_Spread_Change": np.full(months, us_spread_chg),
+                "UK_Spread_Change": np.full(months, uk_spread_chg),
+                "Predicted_US_Return": np.full(months, prediction_us_ret),
+                "Predicted_UK_Return": np.full(months, prediction_uk_ret),
+                "Cum_US_Return": cum_us_ret,
+                "Cum_UK_Return": cum_uk_ret,
+                "US_Spread_Level": current_us_spread + us_spread_chg * months_idx,
+                "UK_Spread_Level": current_uk_spread + uk_spread_chg * months_idx,
+            },
+            index=pd.Index(months_idx, name="Month"),
+        )
 
         print(f"\nScenario: {name}")
         print(f"Total US rate change: {total_us_rate_change * 100:.1f} bp")
         print(f"Total UK rate change: {total_uk_rate_change * 100:.1f} bp")
         print(f"Over {months} months")
-        print(f"Final cum US bond return (approx): {cum_us_ret * 100:.2f}%")
-        print(f"Final cum UK bond return (approx): {cum_uk_ret * 100:.2f}%")
+        print(f"Final cum US bond return (approx): {cum_us_ret[-1] * 100:.2f}%")
+        print(f"Final cum UK bond return (approx): {cum_uk_ret[-1] * 100:.2f}%")
         print(f"US spread change: {sim_results['US_Spread_Change'].sum() * 100:.1f} bp")
         print(f"UK spread change: {sim_results['UK_Spread_Change'].sum() * 100:.1f} bp")
 
         return sim_results
 
-    def plot_simulation(self, sim_df: pd.DataFrame, title: str) -> None:
+    def plot_simulation(
+        self, sim_df: pd.DataFrame, title: str, interactive: bool = True
+    ) -> go.Figure:
         """Create an interactive Plotly visualisation of simulation results.
 
         Plots cumulative returns for US and UK bond indices (left axis)
-        and yield spread levels (right axis).
+        and yield spread levels (right axis). The figure is only shown when
+        ``interactive`` is set and the NO_PLOT environment variable is unset.
 
         Arguments
         ----------
             sim_df: DataFrame returned by simulate_event()
             title: Title of the plot
+            interactive: Display the figure with fig.show()
+
+        Returns
+        -------
+            The Plotly figure
         """
         fig = go.Figure()
         fig.add_trace(
@@ -210,27 +212,37 @@ class EventSimulator:
             hovermode="x unified",
             height=600,
         )
-        fig.show()
+        if interactive and not os.getenv("NO_PLOT"):
+            fig.show()
+        return fig
 
 
 def main() -> None:
     """Run example simulation demonstrating QE-type policy impact."""
     repo_root = Path(__file__).parents[2].resolve()
-    data_path = repo_root / "data/policy_impacts/combined_data.csv"
+    data_path = repo_root / "data/policy_impacts/combined_data.parquet"
     simulator = EventSimulator(data_path)
     simulator.fit_model()
 
-    sim_df = simulator.simulate_event(
-        name="QE - 50bp cut (low growth)",
-        total_us_rate_change=-0.5,
-        total_uk_rate_change=-0.3,
-        months=12,
-        spread_impact_factor=0.0,
-    )
-
-    simulator.plot_simulation(
-        sim_df, title="Simulated Bond Returns under QE Policy Event"
-    )
+    scenarios = [
+        (
+            "QE - 50bp cut (low growth)",
+            "Simulated Bond Returns under QE Policy Event",
+            dict(total_us_rate_change=-0.5, total_uk_rate_change=-0.3),
+        ),
+        (
+            "QT - 50bp hike (sticky inflation)",
+            "Simulated Bond Returns under QT Policy Event",
+            dict(total_us_rate_change=0.5, total_uk_rate_change=0.3),
+        ),
+    ]
+
+    # Models are fitted once above and shared by every scenario
+    for name, title, rate_changes in scenarios:
+        sim_df = simulator.simulate_event(
+            name=name, months=12, spread_impact_factor=0.0, **rate_changes
+        )
+        simulator.plot_simulation(sim_df, title=title, interactive=sys.stdout.isatty())
 
 
 if __name__ == "__main__":
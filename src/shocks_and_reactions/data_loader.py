@@ -3,12 +3,17 @@
 This module provides a ``DataLoader`` class that fetches historical data from the Federal Reserve Economic Data
 (FRED) service and Yahoo Finance, aligns the datasets on S&P 500 trading days, computes key derived variables
 such as S&P 500 daily returns and changes in the effective federal funds rate, and saves the cleaned combined
-dataset to a CSV file in the project's data directory.
+dataset to a Parquet file in the project's data directory.
 
 The script can be run directly to execute the data loading process.
 """
 
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from dotenv import load_dotenv
@@ -24,39 +29,56 @@ class DataLoader:
 
     It fetches data from FRED (Federal Reserve Economic Data) and Yahoo Finance,
     aligns the datasets on trading days, computes returns and changes, and saves
-    the combined dataset to a CSV file.
+    the combined dataset to a Parquet file.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_ttl: float = 24 * 60 * 60) -> None:
         """Initialise the DataLoader instance.
 
         Determines the repository root directory and sets up the data directory
-        for saving the combined dataset.
+        for saving the combined dataset, plus a cache directory for downloads.
+
+        Parameters
+        ----------
+        cache_ttl : float, optional
+            Maximum age in seconds of a cached download before it is fetched
+            again, by default one day.
         """
         repo_root = Path(__file__).resolve().parents[2]
         self.data_dir = repo_root / "data" / "shocks_and_reactions"
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = repo_root / "data" / ".cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
 
     def load_data(self) -> None:
         """Load, process, and save the combined economic and market dataset.
 
         Fetches data from FRED and Yahoo Finance, aligns them, computes S&P 500
         returns and federal funds rate changes, drops missing values, and saves
-        the result to CSV.
+        the result to Parquet.
         """
-        fred_data = self._load_fred_data()
-        yf_data = self._load_yf_data()
-
-        trading_days = yf_data.index
-        fred_data = fred_data.reindex(trading_days)
-
-        combined_data = self._combine_data(fred_data, yf_data)
-
-        combined_data["SP500_Return"] = combined_data["Close"].pct_change()
-        combined_data["Rate_Change"] = combined_data[
-            "Effective Federal Funds Rate"
-        ].diff()
-        combined_data.dropna(inplace=True)
+        # FRED and Yahoo Finance downloads are network-bound; run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fred_future = executor.submit(self._load_fred_data)
+            yf_future = executor.submit(self._load_yf_data)
+            fred_data = fred_future.result()
+            yf_data = yf_future.result()
+
+        # Align FRED onto the trading calendar, carrying the latest observation
+        # forward, instead of outer-joining, re-sorting and forward-filling both
+        fred_data = fred_data.reindex(yf_data.index, method="ffill")
+
+        combined_data = pd.concat([fred_data, yf_data], axis=1)
+        combined_data.index.name = "Date"
+
+        # Both derived columns in one pass over the raw arrays and a single assign
+        close = combined_data["Close"].to_numpy(dtype=np.float64)
+        rate = combined_data["Effective Federal Funds Rate"].to_numpy(dtype=np.float64)
+        combined_data = combined_data.assign(
+            SP500_Return=np.concatenate(([np.nan], close[1:] / close[:-1] - 1)),
+            Rate_Change=np.concatenate(([np.nan], np.diff(rate))),
+        ).dropna()
 
         self._save_data(combined_data)
 
@@ -74,16 +96,19 @@ class DataLoader:
         fred_api_key = os.getenv("FRED_API_KEY")
         fred = Fred(api_key=fred_api_key)
 
-        effective_rate = fred.get_series(
-            series_id="DFF",
-            observation_start="2020-01-01",
-            observation_end="2025-12-31",
-        )
-        m1_money_supply = fred.get_series(
-            series_id="M1SL",
-            observation_start="2020-01-01",
-            observation_end="2025-12-31",
-        )
+        def _get_series(series_id: str) -> pd.Series:
+            return self._cached_fetch(
+                f"fred:{series_id}:2020-01-01:2025-12-31",
+                lambda: fred.get_series(
+                    series_id=series_id,
+                    observation_start="2020-01-01",
+                    observation_end="2025-12-31",
+                ).to_frame(name=series_id),
+            )[series_id]
+
+        # Issue both FRED requests concurrently instead of back to back
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            effective_rate, m1_money_supply = executor.map(_get_series, ["DFF", "M1SL"])
 
         effective_rate = effective_rate.to_frame(name="Effective Federal Funds Rate")
         m1_money_supply = m1_money_supply.to_frame(name="M1 Money Supply")
@@ -107,12 +132,15 @@ class DataLoader:
         ValueError
             If no data is fetched or the DataFrame is empty.
         """
-        yf_data = yf.download(
-            tickers="^GSPC",
-            start="2020-01-01",
-            end="2025-12-31",
-            progress=False,
-            multi_level_index=False,
+        yf_data = self._cached_fetch(
+            "yf:^GSPC:2020-01-01:2025-12-31",
+            lambda: yf.download(
+                tickers="^GSPC",
+                start="2020-01-01",
+                end="2025-12-31",
+                progress=False,
+                multi_level_index=False,
+            ),
         )
 
         if yf_data is None or yf_data.empty:
@@ -120,12 +148,43 @@ class DataLoader:
 
         return yf_data
 
+    def _cached_fetch(
+        self, key: str, fetch: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return the result of ``fetch``, reusing an on-disk copy while it is fresh.
+
+        Downloads are stored as Parquet files in ``cache_dir``, named by a hash
+        of ``key``. A cached file younger than ``cache_ttl`` seconds is read back
+        instead of calling ``fetch``; empty results are never cached.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the request, e.g. source, series id and date range.
+        fetch : Callable[[], pd.DataFrame]
+            Function performing the download on a cache miss.
+
+        Returns
+        -------
+        pd.DataFrame
+            The cached or freshly downloaded data.
+        """
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        path = self.cache_dir / f"{digest}.parquet"
+        if path.exists() and time.time() - path.stat().st_mtime < self.cache_ttl:
+            return pd.read_parquet(path)
+
+        data = fetch()
+        if data is not None and not data.empty:
+            data.to_parquet(path)
+        return data
+
     def _combine_data(
         self, dataset_1: pd.DataFrame, dataset_2: pd.DataFrame
     ) -> pd.DataFrame:
         """Combine two DataFrames by joining on their indices.
 
-        Performs an outer join, sorts by date, forward-fills missing values,
+        Performs an outer concat, sorts by date, forward-fills missing values,
         and drops any remaining rows with NaN.
 
         Parameters
@@ -140,22 +199,29 @@ class DataLoader:
         pd.DataFrame
             The combined, cleaned DataFrame with 'Date' as the index name.
         """
-        data = dataset_1.join(dataset_2, how="outer")
-        data.sort_index(inplace=True)
+        # An outer concat on DatetimeIndexes already returns the sorted union,
+        # so only sort when an input arrived out of order
+        data = pd.concat([dataset_1, dataset_2], axis=1, join="outer")
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
         data = data.ffill()
         data.dropna(inplace=True)
         data.index.name = "Date"
         return data
 
     def _save_data(self, combined_data: pd.DataFrame) -> None:
-        """Save the combined DataFrame to a CSV file.
+        """Save the combined DataFrame to a Parquet file.
 
         Parameters
         ----------
         combined_data : pd.DataFrame
             The processed DataFrame to save.
         """
-        combined_data.to_csv(self.data_dir / "combined_data.csv")
+        combined_data.to_parquet(
+            self.data_dir / "combined_data.parquet",
+            engine="pyarrow",
+            compression="zstd",
+        )
 
 
 def main():
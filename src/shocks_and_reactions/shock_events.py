@@ -4,12 +4,74 @@ This module provides a class to detect significant interest rate changes (shocks
 around FOMC announcement dates, compute cumulative returns, perform a simple
 lagged-return regression, and visualise average market reactions.
 """
+import os
+import sys
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 import statsmodels.api as sm
-import plotly.express as px
 from pathlib import Path
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# FOMC announcement dates, parsed once at import
+_FOMC_DATES = np.array(
+    [
+        "2020-01-29",
+        "2020-03-03",
+        "2020-03-15",
+        "2020-04-29",
+        "2020-06-10",
+        "2020-07-29",
+        "2020-09-16",
+        "2020-11-05",
+        "2020-12-16",
+        "2021-01-27",
+        "2021-03-17",
+        "2021-04-28",
+        "2021-06-16",
+        "2021-07-28",
+        "2021-09-22",
+        "2021-11-03",
+        "2021-12-15",
+        "2022-01-26",
+        "2022-03-16",
+        "2022-05-04",
+        "2022-06-15",
+        "2022-07-27",
+        "2022-09-21",
+        "2022-11-02",
+        "2022-12-14",
+        "2023-02-01",
+        "2023-03-22",
+        "2023-05-03",
+        "2023-06-14",
+        "2023-07-26",
+        "2023-09-20",
+        "2023-11-01",
+        "2023-12-13",
+        "2024-01-31",
+        "2024-03-20",
+        "2024-05-01",
+        "2024-06-12",
+        "2024-07-31",
+        "2024-09-18",
+        "2024-11-07",
+        "2024-12-18",
+        "2025-01-29",
+        "2025-03-19",
+        "2025-05-07",
+        "2025-06-18",
+        "2025-07-30",
+        "2025-09-17",
+        "2025-10-29",
+        "2025-12-10",
+    ],
+    dtype="datetime64[D]",
+)
+
 
 class IdentifyShockEvents:
     """Class for detecting and analysing S&P 500 responses to FOMC rate shocks.
@@ -18,7 +80,7 @@ class IdentifyShockEvents:
     ----------
         data (pd.DataFrame): Input DataFrame with Date index and columns including
             'SP500_Return' and 'Rate_Change'.
-        _fomc_dates (pd.DatetimeIndex): Hard-coded list of FOMC announcement dates.
+        _fomc_dates (np.ndarray): Hard-coded FOMC announcement dates (datetime64[D]).
     """
     def __init__(self, data):
         """Initialise the shock identification with market and rate data.
@@ -30,75 +92,30 @@ class IdentifyShockEvents:
                 effective federal funds rate as decimal).
         """
         self.data = data
-        fomc_dates = pd.to_datetime(
-            [
-                "2020-01-29",
-                "2020-03-03",
-                "2020-03-15",
-                "2020-04-29",
-                "2020-06-10",
-                "2020-07-29",
-                "2020-09-16",
-                "2020-11-05",
-                "2020-12-16",
-                "2021-01-27",
-                "2021-03-17",
-                "2021-04-28",
-                "2021-06-16",
-                "2021-07-28",
-                "2021-09-22",
-                "2021-11-03",
-                "2021-12-15",
-                "2022-01-26",
-                "2022-03-16",
-                "2022-05-04",
-                "2022-06-15",
-                "2022-07-27",
-                "2022-09-21",
-                "2022-11-02",
-                "2022-12-14",
-                "2023-02-01",
-                "2023-03-22",
-                "2023-05-03",
-                "2023-06-14",
-                "2023-07-26",
-                "2023-09-20",
-                "2023-11-01",
-                "2023-12-13",
-                "2024-01-31",
-                "2024-03-20",
-                "2024-05-01",
-                "2024-06-12",
-                "2024-07-31",
-                "2024-09-18",
-                "2024-11-07",
-                "2024-12-18",
-                "2025-01-29",
-                "2025-03-19",
-                "2025-05-07",
-                "2025-06-18",
-                "2025-07-30",
-                "2025-09-17",
-                "2025-10-29",
-                "2025-12-10",
-            ]
-        ).ravel()
-        self._detect_shocks(fomc_dates, threshold=10)
+        self._fomc_dates = _FOMC_DATES
+
+    def identify_shock_events(
+        self, verbose: bool = False, interactive: bool = True
+    ) -> None:
+        """Run the full pipeline: detect shocks, fit a simple model, and visualise results.
 
-    def identify_shock_events(self) -> None:
-        """Run the full pipeline: detect shocks, fit a simple model, and visualise results."""
-        df, shock_events = self._detect_shocks(self.data.index, threshold=10)
-        self._fit_shocks(df)
-        self._visualise_shocks(shock_events)
+        Arguments
+        ----------
+            verbose: Print the full statsmodels regression summary.
+            interactive: Display the Plotly figures with fig.show().
+        """
+        df, shock_events = self._detect_shocks(self._fomc_dates, threshold=10)
+        self._fit_shocks(df, verbose=verbose)
+        self._visualise_shocks(shock_events, interactive=interactive)
 
     def _detect_shocks(
-        self, dates: pd.Series, threshold: float
+        self, dates: np.ndarray, threshold: float
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Detect rate shocks and build event windows around FOMC dates.
 
         Arguments
         ----------
-            dates: DatetimeIndex of FOMC announcement dates.
+            dates: Array-like of FOMC announcement dates.
             threshold: Absolute rate change in basis points that qualifies as a shock.
 
         Returns
@@ -107,94 +124,145 @@ class IdentifyShockEvents:
                 - df: Original data enriched with shock classification columns.
                 - events_df: Concatenated event windows (±10 to +20 days) around each FOMC date.
         """
-        df = self.data.copy()
+        index_values = self.data.index.to_numpy(dtype="datetime64[ns]")
+        date_values = np.asarray(dates, dtype="datetime64[ns]")
+        dates_sorted = np.sort(date_values)
+
+        # Latest FOMC date on or before each day; NaN before the first meeting
+        fomc_window = np.searchsorted(dates_sorted, index_values, side="right") - 1
+        rate_change_bp = self.data["Rate_Change"].to_numpy(dtype=np.float64) * 100
+        mask = np.abs(rate_change_bp) >= threshold
+        shock_codes = np.select(
+            [mask & (rate_change_bp > 0), mask & (rate_change_bp < 0)],
+            [1, 2],
+            default=0,
+        )
+
+        # Derive every new column up front and attach them in a single assign
+        # rather than copying self.data and inserting them one by one
+        df = self.data.assign(
+            is_fomc_date=np.isin(index_values, dates_sorted),
+            FOMC_Window=np.where(fomc_window >= 0, fomc_window, np.nan),
+            Shock_Type=pd.Categorical.from_codes(
+                shock_codes, categories=["No Shock", "Hike", "Cut"]
+            ),
+        )
 
-        df["is_fomc_date"] = df.index.isin(dates)
-        df["FOMC_Window"] = df.index.map(
-            lambda d: next((i for i, date in enumerate(dates) if d >= date), None)
+        # Row bounds of every [date - 10d, date + 20d] window, gathered in one take
+        # instead of slicing and concatenating a frame per event
+        event_index = pd.DatetimeIndex(date_values).as_unit(self.data.index.unit)
+        event_values = event_index.to_numpy()
+        lo = np.searchsorted(index_values, event_values - np.timedelta64(10, "D"))
+        hi = np.searchsorted(
+            index_values, event_values + np.timedelta64(20, "D"), side="right"
         )
-        df["Rate_Change_bp"] = df["Rate_Change"] * 100
-
-        df["Shock_Type"] = "No Shock"
-        mask = df["Rate_Change_bp"].abs() >= threshold
-        df.loc[mask & (df["Rate_Change_bp"] > 0), "Shock_Type"] = "Hike"
-        df.loc[mask & (df["Rate_Change_bp"] < 0), "Shock_Type"] = "Cut"
-
-        event_windows = []
-        for event_date in dates:
-            window = df.loc[
-                event_date - pd.Timedelta(days=10) : event_date + pd.Timedelta(days=20)
-            ].copy()
-            if not window.empty:
-                window["Days_From_Event"] = (window.index - event_date).days
-                window["Event_Date"] = event_date
-
-                window["SP500_Return_%"] = window["SP500_Return"] * 100
-
-                cum_factor = (1 + window["SP500_Return"]).cumprod()
-                window["Cum_Return_%"] = (cum_factor - 1) * 100
-
-                event_windows.append(
-                    window[
-                        [
-                            "SP500_Return_%",
-                            "Days_From_Event",
-                            "Event_Date",
-                            "Cum_Return_%",
-                            "Shock_Type",
-                        ]
-                    ]
-                )
-
-        if event_windows:
-            events_df = pd.concat(event_windows)
-        else:
-            events_df = df.iloc[0:0][
-                [
-                    "SP500_Return_%",
-                    "Days_From_Event",
-                    "Event_Date",
-                    "Cum_Return_%",
-                    "Shock_Type",
-                ]
+        counts = hi - lo
+        event_ids = np.repeat(np.arange(len(event_values)), counts)
+        window_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        row_ids = np.repeat(lo, counts) + np.arange(counts.sum()) - window_starts
+
+        events_df = df[["SP500_Return", "Shock_Type"]].take(row_ids)
+        window_event_dates = event_index[event_ids]
+        cum_factor = (1 + events_df["SP500_Return"]).groupby(event_ids).cumprod()
+
+        events_df = events_df.assign(
+            **{
+                "SP500_Return_%": events_df["SP500_Return"] * 100,
+                "Days_From_Event": (events_df.index - window_event_dates).days,
+                "Event_Date": window_event_dates,
+                "Cum_Return_%": (cum_factor - 1) * 100,
+            }
+        )[
+            [
+                "SP500_Return_%",
+                "Days_From_Event",
+                "Event_Date",
+                "Cum_Return_%",
+                "Shock_Type",
             ]
+        ]
 
         return df, events_df
 
-    def _fit_shocks(self, data: pd.DataFrame) -> None:
+    def _fit_shocks(
+        self, data: pd.DataFrame, verbose: bool = False
+    ) -> Tuple[pd.Series, float]:
         """Fit a simple OLS regression of current returns on lagged returns.
 
-        Prints the statsmodels summary to console.
+        Coefficients come from a least-squares solve; the statsmodels fit is
+        only run when its summary is requested.
 
         Arguments
         ----------
             data: DataFrame containing at least 'SP500_Return'.
+            verbose: Print the statsmodels summary to console.
+
+        Returns
+        --------
+            Tuple containing:
+                - params: Intercept ('const') and 'lagged_return' coefficients.
+                - rsquared: Coefficient of determination of the fit.
         """
-        df_reg = data.copy()
-        df_reg["lagged_return"] = df_reg["SP500_Return"].shift(1)
-        df_reg.dropna(inplace=True)
+        # Only the regression's own columns decide which rows are dropped, so
+        # NaNs elsewhere in the frame (e.g. FOMC_Window) do not thin the sample
+        df_reg = pd.DataFrame(
+            {
+                "SP500_Return": data["SP500_Return"],
+                "lagged_return": data["SP500_Return"].shift(1),
+            }
+        ).dropna()
 
         X = sm.add_constant(df_reg["lagged_return"])
         y = df_reg["SP500_Return"]
-        model = sm.OLS(y, X).fit()
-        print(model.summary())
 
-    def _visualise_shocks(self, data: pd.DataFrame) -> None:
+        X_values = X.to_numpy(dtype=np.float64)
+        y_values = y.to_numpy(dtype=np.float64)
+        coef, *_ = np.linalg.lstsq(X_values, y_values, rcond=None)
+        resid = y_values - X_values @ coef
+        rsquared = 1 - (resid @ resid) / ((y_values - y_values.mean()) ** 2).sum()
+
+        if verbose:
+            print(sm.OLS(y, X).fit().summary())
+
+        return pd.Series(coef, index=X.columns), float(rsquared)
+
+    def _visualise_shocks(
+        self, data: pd.DataFrame, interactive: bool = True
+    ) -> Optional[Tuple["go.Figure", "go.Figure"]]:
         """Create Plotly line charts of average cumulative S&P 500 returns around FOMC events.
 
-        Shows two figures:
+        Builds two figures:
             1. Overall average cumulative return.
             2. Average cumulative return separated by shock type (Hike/Cut/No Shock).
 
+        They are only shown when ``interactive`` is set and the NO_PLOT
+        environment variable is unset.
+
         Arguments
         ----------
             data: Event window DataFrame produced by _detect_shocks.
+            interactive: Display the figures with fig.show().
+
+        Returns
+        --------
+            The overall and by-shock-type figures, or None if there is no event data.
         """
         if data.empty:
             print("No event data to visualise.")
-            return
+            return None
+
+        import plotly.express as px
 
-        avg_cum = data.groupby("Days_From_Event")["Cum_Return_%"].mean().reset_index()
+        show = interactive and not os.getenv("NO_PLOT")
+
+        # Hash-group without sorting, then order the small aggregates by day so
+        # the lines are still drawn left to right
+        avg_cum = (
+            data.groupby("Days_From_Event", sort=False)["Cum_Return_%"]
+            .mean()
+            .sort_index()
+            .reset_index()
+        )
 
         fig = px.line(
             avg_cum,
@@ -206,11 +274,15 @@ class IdentifyShockEvents:
         fig.update_layout(
             yaxis_title="Cumulative Return (%)", xaxis_title="Days From Event"
         )
-        fig.show()
+        if show:
+            fig.show()
 
         avg_by_type = (
-            data.groupby(["Days_From_Event", "Shock_Type"])["Cum_Return_%"]
+            data.groupby(
+                ["Days_From_Event", "Shock_Type"], observed=True, sort=False
+            )["Cum_Return_%"]
             .mean()
+            .sort_index()
             .reset_index()
         )
 
@@ -225,18 +297,23 @@ class IdentifyShockEvents:
         fig_type.update_layout(
             yaxis_title="Cumulative Return (%)", xaxis_title="Days From Event"
         )
-        fig_type.show()
+        if show:
+            fig_type.show()
+
+        return fig, fig_type
 
 
 def main():
     """Load combined data and execute the full shock identification and visualisation pipeline."""
     repo_root = Path(__file__).resolve().parents[2]
-    data_path = repo_root / "data" / "shocks_and_reactions" / "combined_data.csv"
+    data_path = repo_root / "data" / "shocks_and_reactions" / "combined_data.parquet"
 
-    data = pd.read_csv(data_path, parse_dates=["Date"], index_col="Date")
+    data = pd.read_parquet(data_path)
 
     shock_identifier = IdentifyShockEvents(data)
-    shock_identifier.identify_shock_events()
+    shock_identifier.identify_shock_events(
+        verbose=True, interactive=sys.stdout.isatty()
+    )
 
 
 if __name__ == "__main__":
@@ -8,17 +8,139 @@ This module provides a class to:
 - Visualise simulation results with dual-axis plots
 
 Dependencies:
+    - numpy
     - pandas
     - statsmodels.api
     - plotly.graph_objects
     - plotly.subplots
+    - pyarrow
+    - scipy.linalg
 """
 
+import os
 from pathlib import Path
+import sys
+import numpy as np
 import pandas as pd
 import statsmodels.api as sm
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import pyarrow.parquet as pq
+from scipy.linalg import solve_triangular
+
+sys.path.insert(0, str(Path(__file__).parents[1].resolve()))
+# Shared with IdentifyShockEvents so the two FOMC calendars cannot drift apart
+from shocks_and_reactions.shock_events import _FOMC_DATES
+
+# Raw columns read from the data file; Adj Close and M1 are optional
+_INPUT_COLUMNS = [
+    "Close",
+    "Adj Close",
+    "Effective Federal Funds Rate",
+    "M1 Money Supply",
+]
+
+# Regressors of the return model, in design-matrix order
+_DESIGN_COLUMNS = [
+    "const",
+    "Rate_Change_bp",
+    "Lagged_M1_Growth",
+    "Lagged_Return",
+    "Shock_Type_Hike",
+    "Shock_Type_Cut",
+]
+
+# Design-matrix position of each shock type's dummy; No_Shock is the baseline
+_SHOCK_COLUMN = {
+    "No_Shock": None,
+    "Hike": _DESIGN_COLUMNS.index("Shock_Type_Hike"),
+    "Cut": _DESIGN_COLUMNS.index("Shock_Type_Cut"),
+}
+
+
+def _engineer_features(
+    close: np.ndarray, effr: np.ndarray, m1: np.ndarray | None
+) -> dict[str, np.ndarray]:
+    """Derive the return and rate regressors from the raw price and rate arrays.
+
+    Each input is read once and every derived column is written in the same
+    pass, instead of chaining pct_change, diff, shift and ffill on the frame.
+    The columns are rows of a single C-contiguous (6, n) block.
+
+    Arguments
+    ---------
+        close: S&P 500 closing levels.
+        effr: Effective federal funds rate in percent.
+        m1: M1 money supply, or None to hold lagged M1 growth at zero.
+
+    Returns
+    -------
+        The derived columns keyed by name, with NaN where a lag is unavailable.
+    """
+    # One preallocated block holds every derived column; each ufunc writes
+    # into its row in place so no intermediate arrays are allocated
+    n = close.size
+    block = np.empty((6, n))
+    block[:, :1] = np.nan  # slice so an empty frame does not raise
+    (
+        sp500_return,
+        rate_change,
+        rate_change_bp,
+        lagged_return,
+        m1_growth,
+        lagged_m1_growth,
+    ) = block
+
+    np.divide(close[1:], close[:-1], out=sp500_return[1:])
+    sp500_return[1:] -= 1
+    np.subtract(effr[1:], effr[:-1], out=rate_change[1:])
+    np.multiply(rate_change, 100, out=rate_change_bp)
+    lagged_return[1:] = sp500_return[:-1]
+
+    features = {
+        "SP500_Return": sp500_return,
+        "Rate_Change": rate_change,
+        "Rate_Change_bp": rate_change_bp,
+        "Lagged_Return": lagged_return,
+    }
+    if m1 is None:
+        lagged_m1_growth[:] = 0.0
+        features["Lagged_M1_Growth"] = lagged_m1_growth
+        return features
+
+    np.divide(m1[1:], m1[:-1], out=m1_growth[1:])
+    m1_growth[1:] -= 1
+    # Forward-fill gaps by carrying the position of the last valid growth value
+    last_valid = np.where(np.isnan(m1_growth), 0, np.arange(n))
+    m1_growth[:] = m1_growth[np.maximum.accumulate(last_valid)]
+    lagged_m1_growth[1:] = m1_growth[:-1]
+
+    features["M1_Growth"] = m1_growth
+    features["Lagged_M1_Growth"] = lagged_m1_growth
+    return features
+
+
+def _ols_cholesky(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Solve the least-squares normal equations through a Cholesky factorisation.
+
+    Falls back to np.linalg.lstsq when X'X is not positive definite, e.g. when
+    the sample contains no hikes or no cuts and a dummy column is all zero.
+
+    Arguments
+    ---------
+        X: Design matrix (including constant).
+        y: Response vector.
+
+    Returns
+    -------
+        The OLS coefficients in the column order of X.
+    """
+    try:
+        L = np.linalg.cholesky(X.T @ X)
+    except np.linalg.LinAlgError:
+        return np.linalg.lstsq(X, y, rcond=None)[0]
+    z = solve_triangular(L, X.T @ y, lower=True)
+    return solve_triangular(L.T, z, lower=False)
 
 
 class EventSimulator:
@@ -41,9 +163,20 @@ class EventSimulator:
 
         Arguments
         ---------
-            data: Path to the CSV file containing combined FRED and Yahoo Finance data.
+            data: Path to the Parquet file containing combined FRED and Yahoo Finance data.
         """
-        self.data = pd.read_csv(data, parse_dates=["Date"], index_col="Date")
+        # Only load the raw columns the simulator derives its features from
+        available = pq.read_schema(data).names
+        self.data = pd.read_parquet(
+            data,
+            engine="pyarrow",
+            columns=[col for col in _INPUT_COLUMNS if col in available],
+        )
+        self.X = None
+        self.y = None
+        self._model = None
+        self._params = None
+        self._param_idx = {}
 
     def feature_engineering(self) -> None:
         """Perform feature engineering on the loaded data.
@@ -52,120 +185,104 @@ class EventSimulator:
         - Calculating daily S&P 500 returns
         - Computing rate changes in basis points
         - Adding lagged returns and M1 money supply growth
-        - Classifying FOMC announcement days and shock types
+        - Classifying shock types (FOMC days are flagged separately by tag_fomc)
 
         Returns
         -------
             None
         """
-        if "Close" in self.data.columns:
-            self.data["SP500_Return"] = self.data["Close"].pct_change()
-        if "Effective Federal Funds Rate" in self.data.columns:
-            self.data["Rate_Change"] = self.data["Effective Federal Funds Rate"].diff()
-        if "Rate_Change" in self.data.columns:
-            self.data["Rate_Change_bp"] = self.data["Rate_Change"] * 100
-
-        if "SP500_Return" in self.data.columns:
-            self.data["Lagged_Return"] = self.data["SP500_Return"].shift(1)
-
+        m1 = None
         if "M1 Money Supply" in self.data.columns:
-            self.data["M1_Growth"] = self.data["M1 Money Supply"].pct_change()
-            self.data["M1_Growth"] = self.data["M1_Growth"].ffill()
-            self.data["Lagged_M1_Growth"] = self.data["M1_Growth"].shift(1)
+            m1 = self.data["M1 Money Supply"].to_numpy(dtype=np.float64)
         else:
             print("Warning: M1 column missing → using 0 as fallback")
-            self.data["Lagged_M1_Growth"] = 0.0
-
-        fomc_dates = pd.to_datetime(
-            [
-                "2020-01-29",
-                "2020-03-03",
-                "2020-03-15",
-                "2020-04-29",
-                "2020-06-10",
-                "2020-07-29",
-                "2020-09-16",
-                "2020-11-05",
-                "2020-12-16",
-                "2021-01-27",
-                "2021-03-17",
-                "2021-04-28",
-                "2021-06-16",
-                "2021-07-28",
-                "2021-09-22",
-                "2021-11-03",
-                "2021-12-15",
-                "2022-01-26",
-                "2022-03-16",
-                "2022-05-04",
-                "2022-06-15",
-                "2022-07-27",
-                "2022-09-21",
-                "2022-11-02",
-                "2022-12-14",
-                "2023-02-01",
-                "2023-03-22",
-                "2023-05-03",
-                "2023-06-14",
-                "2023-07-26",
-                "2023-09-20",
-                "2023-11-01",
-                "2023-12-13",
-                "2024-01-31",
-                "2024-03-20",
-                "2024-05-01",
-                "2024-06-12",
-                "2024-07-31",
-                "2024-09-18",
-                "2024-11-07",
-                "2024-12-18",
-                "2025-01-29",
-                "2025-03-19",
-                "2025-05-07",
-                "2025-06-18",
-                "2025-07-30",
-                "2025-09-17",
-                "2025-10-29",
-                "2025-12-10",
-            ]
-        )
 
-        self.data["is_fomc_date"] = self.data.index.isin(fomc_dates)
+        features = _engineer_features(
+            self.data["Close"].to_numpy(dtype=np.float64),
+            self.data["Effective Federal Funds Rate"].to_numpy(dtype=np.float64),
+            m1,
+        )
+        rate_change_bp = features["Rate_Change_bp"]
+        mask = np.abs(rate_change_bp) >= 10
+        shock_codes = np.select(
+            [mask & (rate_change_bp > 0), mask & (rate_change_bp < 0)],
+            [1, 2],
+            default=0,
+        )
 
-        self.data["Shock_Type"] = "No_Shock"
-        mask = self.data["Rate_Change_bp"].abs() >= 10
-        self.data.loc[mask & (self.data["Rate_Change_bp"] > 0), "Shock_Type"] = "Hike"
-        self.data.loc[mask & (self.data["Rate_Change_bp"] < 0), "Shock_Type"] = "Cut"
+        # Shocks are classified from the float64 rate changes above, while the
+        # stored features are downcast to float32 to halve their footprint; all
+        # derived columns are attached in a single assign
+        self.data = self.data.assign(
+            **{name: values.astype(np.float32) for name, values in features.items()},
+            Shock_Type=pd.Categorical.from_codes(
+                shock_codes, categories=["No_Shock", "Hike", "Cut"]
+            ),
+        )
 
         self.data.dropna(inplace=True)
 
-    def fit_model(self):
+    def tag_fomc(self) -> None:
+        """Flag FOMC announcement days in an ``is_fomc_date`` column.
+
+        Neither the model nor the simulation uses the flag, so it is left out
+        of feature_engineering and only computed on request.
+        """
+        # Membership by binary search over the sorted announcement dates
+        index_days = self.data.index.to_numpy().astype("datetime64[D]")
+        pos = np.searchsorted(_FOMC_DATES, index_days)
+        matched = _FOMC_DATES[np.minimum(pos, _FOMC_DATES.size - 1)] == index_days
+        self.data["is_fomc_date"] = (pos < _FOMC_DATES.size) & matched
+
+    def fit_model(self, verbose: bool = False) -> None:
         """Fit an OLS regression model to predict daily S&P 500 returns.
 
         Uses rate changes, lagged M1 growth, lagged returns, and shock type dummies
-        as predictors. Prints the model summary and stores the fitted model.
+        as predictors and stores the fitted coefficients.
+
+        Arguments
+        ---------
+            verbose: Print the full statsmodels regression summary.
         """
-        self.model_data = self.data.copy()
-        self.model_data = pd.get_dummies(
-            self.model_data, columns=["Shock_Type"], drop_first=True, dtype=float
+        # Fill the design matrix column by column in a fixed order, with
+        # No_Shock as the baseline shock type
+        n = len(self.data)
+        design = np.empty((n, len(_DESIGN_COLUMNS)))
+        design[:, 0] = 1.0
+        design[:, 1] = self.data["Rate_Change_bp"].to_numpy()
+        design[:, 2] = self.data["Lagged_M1_Growth"].to_numpy()
+        design[:, 3] = self.data["Lagged_Return"].to_numpy()
+        shock_type = self.data["Shock_Type"]
+        design[:, 4] = shock_type == "Hike"
+        design[:, 5] = shock_type == "Cut"
+
+        # Wrap the matrix without copying it; pandas 3 copies ndarrays by default
+        X = pd.DataFrame(
+            design, index=self.data.index, columns=_DESIGN_COLUMNS, copy=False
         )
+        y = self.data["SP500_Return"]
 
-        base_features = ["Rate_Change_bp", "Lagged_M1_Growth", "Lagged_Return"]
-        shock_dummies = [
-            col for col in self.model_data.columns if col.startswith("Shock_Type")
-        ]
+        self.X = X
+        self.y = y
+        self._model = None
 
-        X = self.model_data[base_features + shock_dummies]
-        X = sm.add_constant(X)
+        # Coefficients in design-column order for the scalar recursion in simulate_event
+        self._params = _ols_cholesky(design, y.to_numpy(dtype=np.float64))
+        self._param_idx = {col: i for i, col in enumerate(X.columns)}
 
-        y = self.model_data["SP500_Return"]
+        if verbose:
+            print(self.model.summary())
 
-        model = sm.OLS(y, X).fit()
-        print(model.summary())
+    @property
+    def model(self):
+        """The statsmodels OLS results for the last fit, computed on first access.
 
-        self.model = model
-        self.X = X
-        self.y = y
+        fit_model solves for the coefficients itself; the full statsmodels fit
+        is only needed for summary statistics and diagnostics.
+        """
+        if self._model is None and self.X is not None:
+            self._model = sm.OLS(self.y, self.X).fit()
+        return self._model
 
     def simulate_event(
         self,
@@ -189,80 +306,85 @@ class EventSimulator:
         -------
             A DataFrame containing simulated dates, returns, and S&P 500 levels.
         """
-        if self.model is None:
+        if self._params is None:
             raise ValueError("Model not fitted yet. Call fit_model() first.")
+        if shock_type not in _SHOCK_COLUMN:
+            raise ValueError(
+                f"Unknown shock_type {shock_type!r}, expected one of "
+                f"{list(_SHOCK_COLUMN)}"
+            )
 
-        # Extract starting values from the real last date
-        last_row = self.data.iloc[-1]
-        start_date = last_row.name
-        start_sp500 = (
-            last_row["Adj Close"] if "Adj Close" in last_row else last_row["Close"]
-        )
-        start_lagged_return = last_row["Lagged_Return"]
-        start_lagged_m1 = last_row["Lagged_M1_Growth"]
+        # Extract starting values from the real last date, reading scalars
+        # directly rather than materialising the mixed-dtype last row
+        start_date = self.data.index[-1]
+        level_col = "Adj Close" if "Adj Close" in self.data.columns else "Close"
+        start_sp500 = self.data[level_col].iat[-1]
+        start_lagged_return = float(self.data["Lagged_Return"].iat[-1])
+        start_lagged_m1 = float(self.data["Lagged_M1_Growth"].iat[-1])
 
         print(f"Simulation starting from last available date: {start_date}")
         print(f"Starting S&P 500 level: {start_sp500:,.2f}")
         print(f"Starting lagged return: {start_lagged_return:.6f}")
         print(f"Starting lagged M1 growth: {start_lagged_m1:.6f}")
 
-        # Prepare simulation
-        sim_rows = []
-        current_sp500 = start_sp500
-        current_lagged_return = start_lagged_return
-        current_lagged_m1 = start_lagged_m1
-
-        for day in range(days_ahead):
-            # Rate change only applies on the announcement day (day 0)
-            rate_this_day = announcement_rate_change_bp if day == 0 else 0.0
-
-            predictions_dict = {
-                "const": 1.0,
-                "Rate_Change_bp": rate_this_day,
-                "Lagged_M1_Growth": current_lagged_m1,
-                "Lagged_Return": current_lagged_return,
+        # The fitted model reduces to r_t = c_t + beta_lag * r_{t-1}: lagged M1
+        # growth is held fixed, and the rate change and shock dummy only enter
+        # on day 0, so the intercept is c0 on day 0 and c_rest afterwards
+        params = self._params
+        idx = self._param_idx
+        beta_lag = params[idx["Lagged_Return"]]
+        beta_m1 = params[idx["Lagged_M1_Growth"]]
+        c_rest = params[idx["const"]] + beta_m1 * start_lagged_m1
+        c0 = c_rest + params[idx["Rate_Change_bp"]] * announcement_rate_change_bp
+        shock_col = _SHOCK_COLUMN[shock_type]
+        if shock_col is not None:
+            c0 += params[shock_col]
+
+        # From day 0 onwards the path is a linear AR(1), so it has the closed form
+        # r_t = beta_lag**t * (r_0 - mu) + mu around its fixed point mu
+        days = np.arange(days_ahead)
+        r0 = c0 + beta_lag * start_lagged_return
+        if abs(1 - beta_lag) > 1e-12:
+            mu = c_rest / (1 - beta_lag)
+            predicted_returns = np.power(beta_lag, days) * (r0 - mu) + mu
+        else:
+            predicted_returns = r0 + c_rest * days
+        levels = start_sp500 * np.cumprod(1 + predicted_returns)
+
+        simulation_df = pd.DataFrame(
+            {
+                "Simulated_Date": start_date + pd.to_timedelta(days + 1, unit="D"),
+                "Day": days,  # 0 = announcement day
+                "Predicted_Daily_Return_%": predicted_returns * 100,
+                "Cumulative_Return_%": (levels / start_sp500 - 1) * 100,
+                "Simulated_SP500_Level": levels,
             }
-
-            # Add shock type dummies (1 for chosen type, 0 otherwise)
-            for col in self.X.columns:
-                if col.startswith("Shock_Type_"):
-                    dummy_name = col.replace("Shock_Type_", "")
-                    predictions_dict[col] = (
-                        1.0 if (day == 0 and dummy_name == shock_type) else 0.0
-                    )
-
-            # Create prediction DataFrame with correct column order
-            X_predictions = pd.DataFrame([predictions_dict])[self.X.columns]
-
-            # Predict the return for this day
-            predicted_return = self.model.predict(X_predictions)[0]
-
-            # Update current level
-            new_sp500 = current_sp500 * (1 + predicted_return)
-
-            # Store results
-            sim_rows.append(
-                {
-                    "Simulated_Date": start_date + pd.Timedelta(days=day + 1),
-                    "Day": day,  # 0 = announcement day
-                    "Predicted_Daily_Return_%": predicted_return * 100,
-                    "Cumulative_Return_%": (new_sp500 / start_sp500 - 1) * 100,
-                    "Simulated_SP500_Level": new_sp500,
-                }
-            )
-
-            current_sp500 = new_sp500
-            current_lagged_return = predicted_return
-
-        simulation_df = pd.DataFrame(sim_rows)
+        )
         simulation_df = simulation_df.round(4)
 
         return simulation_df
 
     def plot_simulation(
-        self, simulation_df: pd.DataFrame, title: str = "S&P 500 Simulation"
-    ):
-        """Plot the simulated S&P 500 levels over the simulation period."""
+        self,
+        simulation_df: pd.DataFrame,
+        title: str = "S&P 500 Simulation",
+        interactive: bool = True,
+    ) -> go.Figure:
+        """Plot the simulated S&P 500 levels over the simulation period.
+
+        The figure is only shown when ``interactive`` is set and the NO_PLOT
+        environment variable is unset.
+
+        Arguments
+        ---------
+            simulation_df: DataFrame returned by simulate_event().
+            title: Title of the plot.
+            interactive: Display the figure with fig.show().
+
+        Returns
+        -------
+            The Plotly figure.
+        """
         fig = make_subplots(specs=[[{"secondary_y": True}]])
 
         # Primary: Cumulative Return (%)
@@ -302,37 +424,35 @@ class EventSimulator:
 
         fig.add_hline(y=0, line_dash="dot", line_color="gray", secondary_y=False)
 
-        fig.show()
+        if interactive and not os.getenv("NO_PLOT"):
+            fig.show()
+        return fig
 
 
 def main():
     repo_root = Path(__file__).parents[2].resolve()
+    data_path = Path(repo_root / "data/shocks_and_reactions/combined_data.parquet")
 
-    simulator = EventSimulator(
-        data=Path(repo_root / "data/shocks_and_reactions/combined_data.csv")
-    )
+    simulator = EventSimulator(data=data_path)
     simulator.feature_engineering()
-    simulator.fit_model()
-    print("\n=== Simulating a 25bp Rate Hike ===")
-    hike = simulator.simulate_event(
-        days_ahead=10, announcement_rate_change_bp=25.0, shock_type="Hike"
-    )
-    print(hike)
-    simulator.plot_simulation(hike, title="Simulation: 25bp Rate Hike")
-
-    print("\n=== Simulating a 25bp Rate Cut ===")
-    cut = simulator.simulate_event(
-        days_ahead=10, announcement_rate_change_bp=-25.0, shock_type="Cut"
-    )
-    print(cut)
-    simulator.plot_simulation(cut, title="Simulation: 25bp Rate Cut")
-
-    print("\n=== Simulating No Shock ===")
-    base = simulator.simulate_event(
-        days_ahead=10, announcement_rate_change_bp=0.0, shock_type="No_Shock"
-    )
-    print(base)
-    simulator.plot_simulation(base, title="Simulation: No Shock")
+    simulator.fit_model(verbose=True)
+
+    scenarios = [
+        ("Simulating a 25bp Rate Hike", "Simulation: 25bp Rate Hike", 25.0, "Hike"),
+        ("Simulating a 25bp Rate Cut", "Simulation: 25bp Rate Cut", -25.0, "Cut"),
+        ("Simulating No Shock", "Simulation: No Shock", 0.0, "No_Shock"),
+    ]
+
+    # simulate_event is closed-form, so all scenarios reuse the fitted model
+    for header, title, rate_bp, shock_type in scenarios:
+        print(f"\n=== {header} ===")
+        simulation_df = simulator.simulate_event(
+            days_ahead=10, announcement_rate_change_bp=rate_bp, shock_type=shock_type
+        )
+        print(simulation_df)
+        simulator.plot_simulation(
+            simulation_df, title=title, interactive=sys.stdout.isatty()
+        )
 
 
 if __name__ == "__main__":